@@ -1,13 +0,0 @@
-from . import phaseg
-from . import phaseo
-
-from . import capip
-from . import rperm
-
-from ._fluid import Fluid
-from ._layer import Layer
-
-from ._gas import GasPhase
-from ._oil import OilPhase
-
-from ._water import WaterPhase
\ No newline at end of file
@@ -1,9 +0,0 @@
-import importlib
-
-import os
-
-import sys
-
-module = importlib.import_module('phaseo._standings_correlation')
-
-print(getattr(module,'StandingsCorrelation'))
\ No newline at end of file
@@ -1,3 +0,0 @@
-from ._brooks_corey import BrooksCorey
-
-from ._van_genuchten import VanGenuchten
\ No newline at end of file
@@ -1,7 +0,0 @@
-# from . import critical_props
-# from . import compressibility
-# from . import state_equations
-# from . import flow_resistance
-
-# from .compressibility.main import zfactor
-# from .flow_resistance.main import viscosity
\ No newline at end of file
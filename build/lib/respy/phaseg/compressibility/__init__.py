@@ -1,4 +0,0 @@
-from . import direct_method
-from . import dranchuk_abu_kassem
-from . import dranchuk_purvis_robinson
-from . import hall_yarborough
\ No newline at end of file
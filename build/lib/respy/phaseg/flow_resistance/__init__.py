@@ -1,2 +0,0 @@
-from . import carr_kobayashi_burrows
-from . import lee_gonzalez_eakin
\ No newline at end of file
@@ -1,39 +0,0 @@
-"""
-PROPERTIES OF CRUDE OIL SYSTEMS
-
-Petroleum (an equivalent term is crude oil) is a complex mixture consisting
-predominantly of hydrocarbons and containing sulfur, nitrogen,
-oxygen, and helium as minor constituents. The physical and chemical
-properties of crude oils vary considerably and are dependent on the
-centration of the various types of hydrocarbons and minor constituents
-present.
-
-An accurate description of physical properties of crude oils is of a
-considerable importance in the fields of both applied and theoretical science
-and especially in the solution of petroleum reservoir engineering problems.
-Physical properties of primary interest in petroleum engineering
-studies include:
-
-• Fluid gravity
-• Specific gravity of the solution gas
-• Gas solubility
-• Bubble-point pressure
-• Oil formation volume factor
-• Isothermal compressibility coefficient of undersaturated crude oils
-• Oil density
-• Total formation volume factor
-• Crude oil viscosity
-• Surface tension
-
-Data on most of these fluid properties are usually determined by laboratory
-experiments performed on samples of actual reservoir fluids. In
-the absence of experimentally measured properties of crude oils, it is
-necessary for the petroleum engineer to determine the properties from
-empirically derived correlations.
-
-"""
-# from ._standings_correlation import Standing
-# from ._vasquez_beggs_correlation import VasquezBeggs
-# from ._glasos_correlation import Glaso
-# from ._marhouns_correlation import Marhoun
-# from ._petrosky_farshad_correlation import PetroskyFarshad
\ No newline at end of file
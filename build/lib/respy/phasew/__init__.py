@@ -1 +0,0 @@
-from ._water import Water
\ No newline at end of file
@@ -1,5 +0,0 @@
-from .models._brooks_corey import BrooksCorey
-
-from .models._stones_I import StonesI
-from .models._stones_II import StonesII
-from .models._hustad_holt import HustadHolt
\ No newline at end of file
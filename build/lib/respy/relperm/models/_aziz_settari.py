@@ -1,7 +0,0 @@
-import numpy as np
-
-class AzizSettari():
-    """
-    This Model Provides IMBIBITION Relative Permeability MODELS for a THREE-PHASE system.
-
-    """
\ No newline at end of file
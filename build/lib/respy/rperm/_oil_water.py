@@ -1,13 +0,0 @@
-def oil_water(method="brooks_corey",**kwargs):
-	"""
-	Oil-water system relative permeability model
-
-    Sorow   = residual oil saturation in oil-water system
-    Swc     = connate water saturation
-    krowc   = oil relative permeability at connate water saturaton
-    krwor   = water relative permeability at the residual oil saturation
-    no      = oil exponent on relative permeability curve
-    nw      = water exponent on relative permeability curve
-
-	"""
-	pass
\ No newline at end of file
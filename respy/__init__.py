@@ -8,6 +8,6 @@ from ._fluid import Fluid
 from ._layer import Layer
 
 from ._gas import GasPhase
-from ._oil import OilPhase
+from ._oil import OilPhase, OilPhaseBatch
 
-from ._water import WaterPhase
\ No newline at end of file
+from ._water import WaterPhase, WaterFVF
\ No newline at end of file
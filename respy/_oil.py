@@ -1,21 +1,24 @@
-import importlib
-import os
-import sys
-
 import numpy as np
 
 from ._fluid import Fluid
 
 from .phaseo._crude_oil_system import CrudeOilSystem
+from .phaseo._utils import as1d,sweep
+
+from .phaseo._standings_correlation import StandingsCorrelation
+from .phaseo._vasquez_beggs_correlation import VasquezBeggsCorrelation
+from .phaseo._glasos_correlation import GlasosCorrelation
+from .phaseo._marhouns_correlation import MarhounsCorrelation
+from .phaseo._petrosky_farshad_correlation import PetroskyFarshadCorrelation
 
 class OilPhase(CrudeOilSystem):
 
     METHODS = {
-        'standing': 'standings_correlation',
-        'vasquez-beggs': 'vasquez_beggs_correlation',
-        'glaso': 'glasos_correlation',
-        'marhoun': 'marhouns_correlation',
-        'petrosky-farshad': 'petrosky_farshad_correlation',
+        'standing': StandingsCorrelation,
+        'vasquez-beggs': VasquezBeggsCorrelation,
+        'glaso': GlasosCorrelation,
+        'marhoun': MarhounsCorrelation,
+        'petrosky-farshad': PetroskyFarshadCorrelation,
         }
 
     def __init__(self,sgsg:float,gAPI:float,temp:float):
@@ -33,6 +36,12 @@ class OilPhase(CrudeOilSystem):
         self._gAPI  = gAPI
         self._temp  = temp
 
+        self._sgco  = self.gAPI_to_sgco(gAPI)
+
+        # the instance attributes are read-only, so the tuple splatted into
+        # every correlation call is built once here
+        self._props = (sgsg,gAPI,temp)
+
     @property
     def sgsg(self):
         """Get the specific gravity of the solution gas."""
@@ -48,6 +57,11 @@ class OilPhase(CrudeOilSystem):
         """Get the temperature of the reservoir."""
         return self._temp
 
+    @property
+    def sgco(self):
+        """Get the specific gravity of the oil, converted once from API gravity."""
+        return self._sgco
+
     @property
     def props(self):
         """Get the tuple of three main instance attributes:
@@ -57,7 +71,24 @@ class OilPhase(CrudeOilSystem):
         - system temperature in F
 
         """
-        return (self._sgsg,self._gAPI,self._temp)
+        return self._props
+
+    def at_separator(self,psep:float,Tsep:float):
+        """
+        Returns a copy of the oil whose solution gas gravity is corrected to
+        the 100 psig reference separator with Vasquez-Beggs' sgsg_corr:
+
+        >>> oil = OilPhase(0.851,47.1,250).at_separator(150+14.7,60)
+        >>> oil.gass(p,bpp)
+
+        The correction is done once for the fluid (or once per sample of a
+        batch), instead of in every Vasquez-Beggs call that receives psep
+        and Tsep as keyword arguments.
+
+        """
+        sgsg,gAPI,temp = self._props
+
+        return type(self)(VasquezBeggsCorrelation.sgsg_corr(sgsg,gAPI,psep,Tsep),gAPI,temp)
 
     def call(self,method:str="vasquez-beggs"):
         """
@@ -65,19 +96,20 @@ class OilPhase(CrudeOilSystem):
 
         This method uses the `METHODS` mapping to resolve a user-friendly method name 
         (e.g., "vasquez-beggs", "standing", "glaso") into the corresponding internal 
-        correlation class. The method dynamically imports the correct module from the 
-        `phaseo` package and returns the associated class for further use.
+        correlation class. The correlation classes are imported once with the module,
+        so resolving a method is a plain dictionary lookup. Further correlations
+        can be added to the mapping with `register`.
 
         Parameters
         ----------
         method : str, optional
             The correlation method key, as defined in the `METHODS` dictionary. 
             Supported keys:
-            - "standing" → `standings_correlation`
-            - "vasquez-beggs" → `vasquez_beggs_correlation`
-            - "glaso" → `glasos_correlation`
-            - "marhoun" → `marhouns_correlation`
-            - "petrosky-farshad" → `petrosky_farshad_correlation`
+            - "standing" → `StandingsCorrelation`
+            - "vasquez-beggs" → `VasquezBeggsCorrelation`
+            - "glaso" → `GlasosCorrelation`
+            - "marhoun" → `MarhounsCorrelation`
+            - "petrosky-farshad" → `PetroskyFarshadCorrelation`
 
             Default is "vasquez-beggs".
 
@@ -89,12 +121,7 @@ class OilPhase(CrudeOilSystem):
         Raises
         ------
         ValueError
-            If the provided `method` key is not found in `METHODS`, or if the 
-            corresponding module/class cannot be imported.
-        ImportError
-            If the module for the specified correlation cannot be found.
-        AttributeError
-            If the correlation class cannot be found within the imported module.
+            If the provided `method` key is not found in `METHODS`.
 
         Examples
         --------
@@ -103,19 +130,25 @@ class OilPhase(CrudeOilSystem):
         >>> correlation.some_method(...)
 
         """
-        method = self.METHODS[method]
-
-        sys.path.append(os.path.dirname(__file__))
-
-        method_parts = method.split('_')
-        method_class = method_parts[0].capitalize()+''.join(word.capitalize() for word in method_parts[1:])
-        
-        # Import the correct method class dynamically
         try:
-            module = importlib.import_module(f"phaseo._{method}")
-            return getattr(module,method_class)
-        except (ImportError, AttributeError):
+            return self.METHODS[method]
+        except KeyError:
             raise ValueError(f"Method '{method}' not found or invalid.")
+
+    @classmethod
+    def register(cls,method:str,correlation:type):
+        """
+        Adds a correlation class to the `METHODS` mapping under the given name,
+        so it can be selected with the method argument of gass, fvf and comp:
+
+        >>> OilPhase.register("my-correlation",MyCorrelation)
+        >>> OilPhase(sgsg,gAPI,temp).gass(p,bpp,"my-correlation")
+
+        The class is expected to provide the same static methods as the
+        built-in correlations (gass_sat, fvf_sat, fvf_nonsat, comp_nonsat).
+
+        """
+        cls.METHODS[method] = correlation
     
     def gass(self,p:np.ndarray,bpp:float,method='vasquez-beggs',**kwargs):
         """
@@ -154,15 +187,16 @@ class OilPhase(CrudeOilSystem):
         • The Petrosky-Farshad correlation (petrosky_farshad)
 
         """
-        p,corr = np.atleast_1d(p),self.call(method)
-
-        Rsb = corr.gass_sat(bpp,*self.props,**kwargs)
-
-        Rs = np.full_like(p,Rsb)
+        # a single pressure, e.g. one cell in a simulator timestep loop, goes
+        # straight to the float arithmetic of the kernel without array setup
+        if isinstance(p,(int,float)) and isinstance(bpp,(int,float)):
+            return self.call(method).gass_sat(min(p,bpp),*self._props,**kwargs)
 
-        Rs[p<bpp] = corr.gass_sat(p[p<bpp],*self.props,**kwargs)
+        # Rs grows with pressure and stays at Rsb above the bubble point, so
+        # the correlation is evaluated once on pressures clipped at bpp
+        p = np.minimum(as1d(p),bpp)
 
-        return Rs
+        return self.call(method).gass_sat(p,*self._props,**kwargs)
 
     def fvf(self,p:np.ndarray,bpp:float,method='vasquez-beggs',**kwargs):
         """
@@ -215,15 +249,31 @@ class OilPhase(CrudeOilSystem):
         equal to or below the bubble-point pressure.
 
         """
-        p,corr = np.atleast_1d(p),self.call(method)
+        if isinstance(p,(int,float)) and isinstance(bpp,(int,float)):
+            corr = self.call(method)
+            if p>bpp:
+                return corr.fvf_nonsat(p,bpp,*self._props,**kwargs)
+            return corr.fvf_sat(p,*self._props,**kwargs)
+
+        p,props,corr = as1d(p),self._props,self.call(method)
+
+        # a correlation that covers both regimes in one expression (e.g.
+        # Vasquez-Beggs) is evaluated in a single pass over the pressures
+        if hasattr(corr,'fvf'):
+            return corr.fvf(p,bpp,*props,**kwargs)
 
-        Bo = corr.fvf_sat(p,*self.props,**kwargs)
+        Bo = corr.fvf_sat(p,*props,**kwargs)
 
-        Bo[p>bpp] = corr.fvf_nonsat(p[p>bpp],bpp,*self.props,**kwargs)
+        above = p>bpp
 
-        return Bo
+        # a saturated reservoir has no pressure above the bubble point, and the
+        # log/exp of the undersaturated expression is not evaluated at all
+        if not above.any():
+            return Bo
 
-    def rho(self,p,Bo,Rs,sgsg,gAPI,temp,Tsep,psep):
+        return np.where(above,corr.fvf_nonsat(p,bpp,*props,**kwargs),Bo)
+
+    def rho(self,p:np.ndarray,bpp:float,method='vasquez-beggs',**kwargs):
         """
         The crude oil density is defined as the mass of a unit volume of the
         crude at a specified pressure and temperature. It is usually expressed in
@@ -231,33 +281,77 @@ class OilPhase(CrudeOilSystem):
 
         Function to Calculate Oil Density in lb/ft3
 
-        T     : temperature, °F
-        P     : pressure, psia
-        sgsg  : gas specific gravity
-        gAPI  : API oil gravity
+        p     : pressure, psia
+        bpp   : bubble point pressure, psia
+
+        The gas and oil gravities and the temperature are taken from the instance.
+        At and below the bubble point the density is that of the saturated oil,
+
+        rho_sat = (350*sgco+0.0764*sgsg*Rs)/(5.615*Bo)
+
+        Above it, Bo and Rs are the bubble-point values Bob and Rsb, and the
+        oil is compressed with its isothermal compressibility co:
+
+        rho = rho_sat*exp(co*(p-bpp))
 
-        Tsep  : separator temperature, °F
-        psep  : separator pressure, psia
-        Pb    : bubble point pressure, psia
-        Bo    : oil formation volume factor, bbl/stb
-        Rs    : solution gas-oil ratio, scf/stb
+        Rs and Bo of the saturated oil are calculated with the given method on
+        the pressures clipped at bpp, so that they are Rsb and Bob above it;
+        separator conditions (psep, Tsep) can be passed as kwargs. co is only
+        needed, and only calculated, when some pressure is above bpp.
+
+        The method must provide fvf_sat, and comp_nonsat for pressures above
+        the bubble point; otherwise a ValueError is raised. Of the built-in
+        correlations, Vasquez-Beggs covers the whole pressure range, Standing
+        pressures at and below bpp, and the others neither yet.
 
         """
-        # rhor = (rhoSTO+0.01357*Rs*gamma_gas)/fvf
-        # return rhob*numpy.exp(comp*(pres-pbubble))
-        #print(rho(150,2500,65,90,2500,1.23,300,.65,35))
+        p = as1d(p)
+
+        corr,props = self.call(method),self._props
 
-        API_sp = 141.5 / (gAPI + 131.5)
+        # the saturated Rs and Bo at min(p,bpp) are Rs, Bo below the bubble
+        # point and Rsb, Bob above it, from one pass over the clipped pressures
+        q = np.minimum(p,bpp)
 
-        if (P <= Pb):
-            rho_o = (350 * API_sp + 0.0764 * sgsg * Rs) / (5.615 * Bo)
+        if hasattr(corr,'gass_fvf_sat'):
+            Rs,Bo = corr.gass_fvf_sat(q,*props,**kwargs)
         else:
-            co = oil_comp(T, P, Tsep, psep, Rs, sgsg, gAPI)
-            Bob = Bo / (math.exp(co * (P - Pb)))
-            rho_ob = (350 * API_sp + 0.0764 * sgsg * Rs) / (5.615 * Bob)
-            rho_o = rho_ob * Bo / Bob
-        
-        return rho_o
+            Rs,Bo = corr.gass_sat(q,*props,**kwargs),corr.fvf_sat(q,*props,**kwargs)
+
+        # correlations whose Bo is not implemented yet return None
+        if Bo is None:
+            raise ValueError(f"Method '{method}' does not provide the saturated oil formation volume factor (fvf_sat).")
+
+        # the 5.615 of the denominator is folded into the scalar coefficients,
+        # leaving one division by Bo
+        rho_sat = (350/5.615*self._sgco+0.0764/5.615*self._sgsg*Rs)/Bo
+
+        # a saturated reservoir is not compressed, and needs no co at all
+        if not (p>bpp).any():
+            return rho_sat
+
+        comp_nonsat = getattr(corr,'comp_nonsat',None)
+
+        # co is only used above the bubble point, so it is evaluated on the
+        # pressures raised to bpp, where every correlation is within range
+        co = None if comp_nonsat is None else comp_nonsat(np.maximum(p,bpp),bpp,*props,**kwargs)
+
+        if co is None:
+            raise ValueError(f"Method '{method}' does not provide the undersaturated oil compressibility (comp_nonsat) needed above the bubble point.")
+
+        # the pressure excess is zero at and below the bubble point, where the
+        # factor is exp(0)=1, so both regimes come out of one expression; it
+        # is a single exp of co*dp built in place, and is never formed as
+        # Bo/Bob, so no cancellation arises close to the bubble point; the
+        # buffer has the shape of co as well, which of a batch with a single
+        # bubble point is (samples, pressures) while p-bpp is a single row
+        x = np.empty(np.broadcast_shapes(np.shape(p),np.shape(bpp),np.shape(co)))
+        np.subtract(p,bpp,out=x)
+        np.maximum(x,0.,out=x)
+        x *= co
+        np.exp(x,out=x)
+
+        return rho_sat*x
 
     def comp(self,p:np.ndarray,bpp:float,method='vasquez-beggs',**kwargs):
         """
@@ -284,16 +378,122 @@ class OilPhase(CrudeOilSystem):
         • McCain’s correlation
 
         """
-        p,corr = np.atleast_1d(p),self.call(method)
+        p,props,corr = as1d(p),self._props,self.call(method)
+
+        Rsb = corr.gass_sat(bpp,*props,**kwargs)
+
+        co = self.get_comp_sat(p,*props,Rsb,bpp)
+
+        return np.where(p>bpp,corr.comp_nonsat(p,bpp,*props,**kwargs),co)
+
+    def pvt(self,p:np.ndarray,bpp:float,method='vasquez-beggs',**kwargs):
+        """
+        Returns the gas solubility Rs, the oil formation volume factor Bo and
+        the oil compressibility co at the given pressures together, e.g. for
+        the property update of every cell in a simulator timestep:
 
-        Rsb = corr.gass_sat(bpp,*self.props,**kwargs)
+        >>> Rs,Bo,co = oil.pvt(p,bpp)
 
-        co = self.get_comp_sat(p,*self.props,Rsb,bpp)
+        A correlation that provides gass_fvf (e.g. Vasquez-Beggs) evaluates
+        Rs once and composes Bo from it, instead of evaluating the gas
+        solubility power a second time inside fvf.
 
-        co[p>bpp] = corr.comp_nonsat(p[p>bpp],bpp,*self.props,**kwargs)
+        """
+        corr = self.call(method)
 
-        return co
+        if hasattr(corr,'gass_fvf'):
+            Rs,Bo = corr.gass_fvf(as1d(p),bpp,*self._props,**kwargs)
+        else:
+            Rs,Bo = self.gass(p,bpp,method,**kwargs),self.fvf(p,bpp,method,**kwargs)
+
+        return Rs,Bo,self.comp(p,bpp,method,**kwargs)
 
     def visc(self):
 
-        pass
\ No newline at end of file
+        pass
+
+    def sweep(self,prop:str,p:np.ndarray,bpp:float,method='vasquez-beggs',chunk:int=50_000,workers:int|None=None,**kwargs):
+        """
+        Evaluates one of the pressure dependent properties ('gass', 'fvf' or
+        'comp') over a long pressure array, splitting it into chunks that are
+        computed in parallel threads. Short arrays are evaluated in one call.
+        For an OilPhaseBatch the chunks are joined along the pressure axis, so
+        the result is shaped (number of samples, number of pressures).
+
+        >>> oil = OilPhase(sgsg,gAPI,temp)
+        >>> Bo = oil.sweep('fvf',np.linspace(100,5000,1_000_000),2500,'vasquez-beggs')
+
+        """
+        return sweep(getattr(self,prop),p,bpp,method,chunk=chunk,workers=workers,**kwargs)
+
+class OilPhaseBatch(OilPhase):
+    """
+    Oil phase for many samples at once, e.g. a multi-well PVT study.
+
+    The sample descriptors are stored as a structure of arrays (one float64
+    column per property) instead of a list of OilPhase instances, so that
+    gass, fvf and comp evaluate every sample over a pressure array in a single
+    vectorized call. Results are shaped (number of samples, number of pressures).
+
+    """
+
+    def __init__(self,sgsg:np.ndarray,gAPI:np.ndarray,temp:np.ndarray):
+        """
+        Initialize a batch of oil samples.
+
+        Args:
+        ----
+        sgsg (np.ndarray): Specific gravities of solution gas.
+        gAPI (np.ndarray): API gravities of oil.
+        temp (np.ndarray): Temperatures in Fahrenheit.
+
+        The inputs are broadcast against each other, so a scalar can be used
+        for a property shared by all samples.
+
+        """
+        sgsg,gAPI,temp = np.broadcast_arrays(sgsg,gAPI,temp)
+
+        super().__init__(*(np.ascontiguousarray(x,dtype=np.float64).reshape(-1,1) for x in (sgsg,gAPI,temp)))
+
+    @classmethod
+    def from_records(cls,records):
+        """
+        Builds the batch from per-sample records, e.g. a list of
+        (sgsg,gAPI,temp) tuples collected in a PVT study:
+
+        >>> batch = OilPhaseBatch.from_records([(0.851,47.1,250),(0.855,40.7,220)])
+
+        The records are converted to one (N,3) array in a single pass, and
+        its columns become the contiguous property columns of the batch.
+
+        """
+        table = np.asarray(records,dtype=np.float64).reshape(-1,3)
+
+        return cls(*table.T)
+
+    @staticmethod
+    def grid(p:np.ndarray,bpp:float|np.ndarray):
+        """Returns pressures as a row and bubble-point pressures (scalar or
+        one value per sample) as a column for broadcasting."""
+        return np.reshape(p,(1,-1)),np.reshape(bpp,(-1,1))
+
+    def gass(self,p:np.ndarray,bpp:float|np.ndarray,method='vasquez-beggs',**kwargs):
+        """Gas solubility of each sample at the given pressures, scf/STB."""
+        return super().gass(*self.grid(p,bpp),method,**kwargs)
+
+    def fvf(self,p:np.ndarray,bpp:float|np.ndarray,method='vasquez-beggs',**kwargs):
+        """Oil formation volume factor of each sample at the given pressures, bbl/STB."""
+        return super().fvf(*self.grid(p,bpp),method,**kwargs)
+
+    def comp(self,p:np.ndarray,bpp:float|np.ndarray,method='vasquez-beggs',**kwargs):
+        """Oil compressibility of each sample at the given pressures, 1/psi."""
+        return super().comp(*self.grid(p,bpp),method,**kwargs)
+
+    def rho(self,p:np.ndarray,bpp:float|np.ndarray,method='vasquez-beggs',**kwargs):
+        """Oil density of each sample at the given pressures, lb/ft3."""
+        return super().rho(*self.grid(p,bpp),method,**kwargs)
+
+    def pvt(self,p:np.ndarray,bpp:float|np.ndarray,method='vasquez-beggs',**kwargs):
+        """Gas solubility, formation volume factor and compressibility of each
+        sample at the given pressures."""
+        return super().pvt(*self.grid(p,bpp),method,**kwargs)
\ No newline at end of file
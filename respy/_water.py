@@ -1,5 +1,32 @@
 import numpy as np
 
+from numpy.polynomial.polynomial import polyval
+
+# Temperature polynomial coefficients of the water correlations. Row k holds
+# the T**k terms and the columns are C1, C2 and C3 of the pressure polynomial.
+
+_GASS_COEFFS = np.array([
+    [2.12, 1.07e-2, 8.75e-7],
+    [3.45e-3, -5.26e-5, 3.90e-9],
+    [-3.59e-5, 1.48e-07, -1.02e-11],
+    ])
+
+_FVF_COEFFS_GAS_FREE = np.array([
+    [0.9947, -4.228e-6, 1.3e-10],
+    [5.8e-6, 1.8376e-8, -1.3855e-12],
+    [1.02e-6, -6.77e-11, 4.285e-15],
+    ])
+
+_FVF_COEFFS_GAS_SATURATED = np.array([
+    [0.9911, -1.093e-6, -5e-11],
+    [6.35e-5, -3.497e-9, 6.429e-13],
+    [8.5e-7, 4.57e-12, -1.43e-15],
+    ])
+
+def _is_fresh(TDS):
+    """True for a scalar zero salinity, when the salinity corrections are unity."""
+    return np.ndim(TDS) == 0 and TDS == 0
+
 class WaterPhase():
     """
     The objective of this class is to present several of the well-established
@@ -34,17 +61,17 @@ class WaterPhase():
 
         """
         if p is None:
-            return np.exp(1.003 - 1.479e-2*T + 1.982e-5*T**2)
+            return np.exp(1.003 + T * (-1.479e-2 + 1.982e-5 * T))
 
         Y = 10000 * TDS
 
-        A = 0.04518 + 9.313e-7 * Y - 3.93e-12 * Y ** 2
-        B = 70.634 + 9.576e-10 * Y ** 2
+        A = 0.04518 + Y * (9.313e-7 - 3.93e-12 * Y)
+        B = 70.634 + 9.576e-10 * Y * Y
 
         # brine viscosity at p = 14.7, T, cp
         muwd = A + B / T
 
-        mu = muwd * (1 + 3.5e-2 * p ** 2 * (T - 40))
+        mu = muwd * (1 + 3.5e-2 * p * p * (T - 40))
 
         return mu
 
@@ -56,7 +83,25 @@ class WaterPhase():
         TDS  total dissolved solids, wt%
 
         """
-        return (62.368 + 0.438603 * TDS + 1.60074e-3 * TDS ** 2) / Bw
+        return (62.368 + TDS * (0.438603 + 1.60074e-3 * TDS)) / Bw
+
+    @staticmethod
+    def rho_pT(T:float|np.ndarray, p:float|np.ndarray, TDS:float|np.ndarray=0., option:str="gas-free-water"):
+        """Function to Calculate Water Density in lb/ft3 directly from
+        temperature and pressure, without materializing Bw for the caller:
+
+        T      : Temperature of interest, °F
+        p      : Pressure of interest, psia
+        TDS    : Total dissolved solids, wt%
+        option : water type, "gas-free-water" or "gas-saturated-water"
+
+        The standard-condition density depends only on TDS, so it is evaluated
+        once and divided by the formation volume factor over the pressures.
+
+        """
+        rhosc = 62.368 + TDS * (0.438603 + 1.60074e-3 * TDS)
+
+        return rhosc / WaterFVF(T, TDS, option)(p)
 
     @staticmethod
     def salinity(spgr):
@@ -64,13 +109,16 @@ class WaterPhase():
 
         spgr specific gravity of water
 
-        """
-        rho = 62.368 * spgr
+        The positive root of the density polynomial is taken in the form
+        -2c / (b + sqrt(b^2 - 4ac)), which avoids the cancellation of -b + sqrt()
+        for near-fresh water. spgr may be an array.
 
+        """
         a = 0.00160074
         b = 0.438603
-        c = 62.368 - rho
-        s = (-b + (b ** 2 - 4 * a * c) ** 0.5) / (2 * a)
+        c = 62.368 * (np.asarray(spgr) - 1)   # negated constant term, -c
+
+        s = 2 * c / (b + np.sqrt(b * b + 4 * a * c))
 
         return s
 
@@ -94,7 +142,7 @@ class WaterPhase():
         C2 = -0.01052 + 4.77e-7 * p
         C3 = 3.9267e-5 - 8.8e-10 * p
 
-        return (C1 + C2*T + C3*T**2) * 1e-6
+        return (C1 + T * (C2 + T * C3)) * 1e-6
 
     @staticmethod
     def fvf(T:float|np.ndarray, p:float|np.ndarray, TDS:float|np.ndarray=0., option:str="gas-free-water"):
@@ -114,28 +162,11 @@ class WaterPhase():
         -------
         Water formation volume factor (Bw) in bbl/STB
 
-        """
-        match option:
+        The temperature dependent coefficients are evaluated by WaterFVF;
+        use it directly to reuse them over many pressure sweeps.
 
-            case "gas-free-water":
-                C1 = 0.9947 + 5.8e-6 * T + 1.02e-6 * T ** 2
-                C2 = -4.228e-6 + 1.8376e-8 * T - 6.77e-11 * T ** 2
-                C3 = 1.3e-10 - 1.3855e-12 * T + 4.285e-15 * T ** 2
-            case "gas-saturated-water":
-                C1 = 0.9911 + 6.35e-5 * T + 8.5e-7 * T ** 2
-                C2 = -1.093e-6 - 3.497e-9 * T + 4.57e-12 * T ** 2
-                C3 = -5e-11 + 6.429e-13 * T - 1.43e-15 * T ** 2
-            case _:
-                raise ValueError("Invalid option. Choose 'gas-free-water' or 'gas-saturated-water'.")  
-
-        Bw = C1 + C2 * p + C3 * p ** 2
-
-        Y = 10000 * TDS
-        x = 5.1e-8 * p + (T - 60) * (5.47e-6 - 1.95e-10 * p) + (T - 60) ** 2 * (-3.23e-8 + 8.5e-13 * p)
-
-        Bw = Bw * (1 + 0.0001 * x * Y)
-
-        return Bw
+        """
+        return WaterFVF(T, TDS, option)(p)
 
     @staticmethod
     def gass(T:float|np.ndarray, p:float|np.ndarray, TDS:float|np.ndarray=0.):
@@ -155,16 +186,17 @@ class WaterPhase():
         Gas solubility in water in scf/stb.
 
         """
-        C1 = 2.12 + 3.45e-3 * T - 3.59e-5 * T ** 2
-        C2 = 1.07e-2 - 5.26e-5 * T + 1.48e-07 * T ** 2
-        C3 = 8.75e-7 + 3.90e-9 * T - 1.02e-11 * T ** 2
+        C1, C2, C3 = polyval(T, _GASS_COEFFS)
 
-        Rswp = C1 + C2 * p + C3 * p ** 2
+        Rswp = C1 + p * (C2 + p * C3)
 
-        Y = 10000 * TDS
+        if _is_fresh(TDS):
+            return Rswp
+
+        # 0.0001 * x * Y with Y = 10000 * TDS reduces to x * TDS
         x = 3.471 * T ** -0.837
 
-        Rsw = Rswp * (1 - 0.0001 * x * Y)
+        Rsw = Rswp * (1 - x * TDS)
 
         return Rsw
 
@@ -177,17 +209,63 @@ class WaterPhase():
         T      : Temperature of interest, °F
         p      : Pressure of interest, psia
         
+        The tension is interpolated linearly in temperature between the 74°F
+        and 280°F curves, held constant outside that range and limited to a
+        minimum of 1 dynes/cm. T and p may be arrays that broadcast together.
+
         """
+        p = np.asarray(p)
+
         s74 = 75 - 1.108 * p ** 0.349
         s280 = 53 - 0.1048 * p ** 0.637
-        if (T <= 74):
-            sw = s74
-        elif(T >= 280):
-            sw = s280
-        else:
-            sw = s74 - (T - 74) * (s74 - s280) / 206
-        
-        if (sw < 1):
-            sw = 1
-        
-        return sw
\ No newline at end of file
+
+        sw = s74 - (np.clip(T, 74., 280.) - 74) * (s74 - s280) / 206
+
+        return np.maximum(sw, 1.)
+
+class WaterFVF():
+    """Water formation volume factor at a fixed temperature and salinity.
+
+    Every coefficient of the correlation that does not depend on pressure is
+    computed once at initialization, so calling the instance with pressures
+    evaluates two short polynomials per point.
+
+    """
+
+    def __init__(self, T:float|np.ndarray, TDS:float|np.ndarray=0., option:str="gas-free-water"):
+        """Initialization parameters are:
+
+        T      : Temperature of interest, °F
+        TDS    : Total dissolved solids, wt%
+        option : water type, "gas-free-water" or "gas-saturated-water"
+
+        """
+        match option:
+
+            case "gas-free-water":
+                coeffs = _FVF_COEFFS_GAS_FREE
+            case "gas-saturated-water":
+                coeffs = _FVF_COEFFS_GAS_SATURATED
+            case _:
+                raise ValueError("Invalid option. Choose 'gas-free-water' or 'gas-saturated-water'.")
+
+        self._C1, self._C2, self._C3 = polyval(T, coeffs)
+
+        # salinity correction 1 + 0.0001 * x * Y, with Y = 10000 * TDS and x
+        # linear in pressure, is split into its constant and pressure terms;
+        # it is skipped altogether for fresh water
+        self._fresh = _is_fresh(TDS)
+
+        if not self._fresh:
+            dT = T - 60
+            self._S0 = 1 + TDS * dT * (5.47e-6 - 3.23e-8 * dT)
+            self._S1 = TDS * (5.1e-8 + dT * (-1.95e-10 + 8.5e-13 * dT))
+
+    def __call__(self, p:float|np.ndarray):
+        """Returns water formation volume factor (Bw) in bbl/STB for pressures in psia."""
+        Bw = self._C1 + p * (self._C2 + p * self._C3)
+
+        if self._fresh:
+            return Bw
+
+        return Bw * (self._S0 + p * self._S1)
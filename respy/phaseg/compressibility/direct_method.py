@@ -1,6 +1,6 @@
 import numpy as np
 
-from scipy import optimize
+_LN10 = np.log(10.)
 
 def zfact(Tr, Pr):
     """Function to Calculate Gas Compressibility Factor
@@ -10,11 +10,11 @@ def zfact(Tr, Pr):
     """
     #'Tr         reduced temperatue
     #'Pr         reduced pressure
-    a = 1.39 * (Tr - 0.92) ** 0.5 - 0.36 * Tr - 0.101
+    a = 1.39 * np.sqrt(Tr - 0.92) - (0.36 * Tr + 0.101)
     b = (0.62 - 0.23 * Tr) * Pr + (0.066 / (Tr - 0.86) - 0.037) * Pr ** 2 + 0.32 * Pr ** 6 / (10 ** (9 * (Tr - 1)))
-    c = (0.132 - 0.32 * math.log(Tr) / math.log(10))
+    c = 0.132 - 0.32 * np.log10(Tr)
     d = 10 ** (0.3106 - 0.49 * Tr + 0.1824 * Tr ** 2)
-    return a + (1 - a) * math.exp(-b) + c * Pr ** d
+    return a + (1 - a) * np.exp(-b) + c * Pr ** d
 
 def gas_fvf(P, T, grav):
     """Function to Calculate Gas Formation Volume Factor in ft_/scf"""
@@ -61,49 +61,55 @@ class DirectMethod():
 	@property
 	def pcrit(self):
 		"""Critical Pressure in psi, underscore parameter is in SI units."""
-		return self._pcrit/6894.76
+		return self._pcrit_psi
 
 	@pcrit.setter
 	def pcrit(self,value:float):
-		"""Critical Pressure in SI units, Pascal."""
+		"""Critical Pressure in SI units, Pascal. The psi value is kept as well,
+		so the getter does not convert back on every access."""
+		self._pcrit_psi = value
 		self._pcrit = value*6894.76
 
 	@property
 	def tcrit(self):
 		"""Critical Temperature in Rankine, underscore parameter is in SI units."""
-		return self._tcrit*(9./5)
+		return self._tcrit_rankine
 
 	@tcrit.setter
 	def tcrit(self,value:float):
 		"""Critical Temperature in SI units, Kelvin."""
+		self._tcrit_rankine = value
 		self._tcrit = value*(5./9)
 
 	@property
 	def temp(self):
 		"""Temperature in Rankine, underscore parameter is in SI units."""
-		return self._temp*(9./5)
+		return self._temp_rankine
 
 	@temp.setter
 	def temp(self,value:float):
 		"""Temperature in SI units, Kelvin."""
+		self._temp_rankine = value
 		self._temp = value*(5./9)
 
 	@property
 	def treduced(self):
 		"""Returns reduced temperature (class property)."""
-		return self.temp/self.tcrit
+		return self._temp_rankine/self._tcrit_rankine
 
 	def preduced(self,press:np.ndarray):
 		"""Returns reduced pressure values for input pressure values in psi."""
-		return np.asarray(press)/self.pcrit
+		return np.asarray(press)/self._pcrit_psi
 
 	@staticmethod
 	def get_a(treduced):
-		return 1.39*(treduced-0.92)**0.5-0.36*treduced-0.101
+		return 1.39*np.sqrt(treduced-0.92)-(0.36*treduced+0.101)
 
 	@staticmethod
 	def get_b(preduced,treduced):
-		return (0.62-0.23*treduced)*preduced+(0.066/(treduced-0.86)-0.037)*preduced**2+0.32*preduced**6/(10**(9*(treduced-1)))
+		# Horner form; the reduced pressure powers are built by multiplication
+		p3 = preduced*preduced*preduced
+		return ((0.62-0.23*treduced)+(0.066/(treduced-0.86)-0.037)*preduced)*preduced+0.32*np.exp(-9*_LN10*(treduced-1))*p3*p3
 
 	@staticmethod
 	def get_c(treduced):
@@ -111,24 +117,34 @@ class DirectMethod():
 
 	@staticmethod
 	def get_d(treduced):
-		return 10**(0.3106-0.49*treduced+0.1824*treduced**2)
+		return np.exp(_LN10*(0.3106+treduced*(-0.49+0.1824*treduced)))
 
 	@staticmethod
 	def get_e(preduced,treduced):
 		# e is defined as the derivative of b w.r.t Pr
-		return (0.62-0.23*treduced)+(0.132/(treduced-0.86)-0.074)*preduced+1.92*preduced**5/(10**(9*(treduced-1)))
+		p2 = preduced*preduced
+		return (0.62-0.23*treduced)+(0.132/(treduced-0.86)-0.074)*preduced+1.92*np.exp(-9*_LN10*(treduced-1))*p2*p2*preduced
 
 	def __call__(self,press:np.ndarray,derivative:bool=False):
 
-		preduced = self.preduced(press)
+		preduced,treduced = self.preduced(press),self.treduced
 
-		b = self.get_b(preduced,self.treduced)
-		e = self.get_e(preduced,self.treduced)
+		b = self.get_b(preduced,treduced)
 
-		if derivative:
-			return self.zvalue(preduced,b),self.zprime(preduced,b,e)
+		if not derivative:
+			return self.zvalue(preduced,b)
 
-		return self.zvalue(preduced,b)
+		e = self.get_e(preduced,treduced)
+
+		# z and z prime share exp(-b), so it is evaluated once for both
+		# outputs; z keeps its own preduced**d, since powd*preduced is
+		# inf*0 = NaN at zero pressure when d<1
+		expb = np.exp(-b)
+
+		zvalue = self.a+(1-self.a)*expb+self.c*preduced**self.d
+		zprime = (self.a-1)*expb*e+self.c*self.d*preduced**(self.d-1)
+
+		return zvalue,zprime
 
 	def zvalue(self,preduced,b):
 		"""Internal function to calculate z factor when the class is called."""
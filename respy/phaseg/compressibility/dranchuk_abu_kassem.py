@@ -1,7 +1,5 @@
 import numpy
 
-from scipy import optimize
-
 class DranchukAbuKassem():
 	"""
 	Dranchuk-Abu-Kassem Method represents the Standing-Katz correlation:
@@ -103,6 +101,9 @@ class DranchukAbuKassem():
 
 	def __call__(self,press:numpy.ndarray,derivative:bool=False):
 
+		# scipy.optimize is heavy to import, so it is loaded on the first call
+		from scipy import optimize
+
 		preduced = self.preduced(press)
 
 		if numpy.any(preduced>30):
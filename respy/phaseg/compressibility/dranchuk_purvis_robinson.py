@@ -1,7 +1,5 @@
 import numpy
 
-from scipy import optimize
-
 class DranchukPurvisRobinson():
 	"""
 	Dranchuk-Purvis-Robinson Method: Provides function to calculate
@@ -106,6 +104,9 @@ class DranchukPurvisRobinson():
 
 	def __call__(self,press:numpy.ndarray,derivative:bool=False):
 
+		# scipy.optimize is heavy to import, so it is loaded on the first call
+		from scipy import optimize
+
 		preduced = self.preduced(press)
 
 		if self.treduced<1.05 or self.treduced>3 or numpy.any(preduced<0.2) or numpy.any(preduced>3.0):
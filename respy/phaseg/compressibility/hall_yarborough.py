@@ -1,7 +1,5 @@
 import numpy
 
-from scipy import optimize
-
 class HallYarborough():
 	"""
 	Hall Yarborough Method: Provides function to calculate
@@ -93,6 +91,9 @@ class HallYarborough():
 
 	def __call__(self,press:numpy.ndarray,derivative:bool=False):
 
+		# scipy.optimize is heavy to import, so it is loaded on the first call
+		from scipy import optimize
+
 		preduced = self.preduced(press)
 
 		X1 = 0.06125*preduced/self.treduced*numpy.exp(-1.2*(1-1/self.treduced)**2)
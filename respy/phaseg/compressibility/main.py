@@ -1,10 +1,21 @@
-import os, sys
-
 import numpy as np
 
+from .direct_method import DirectMethod
+from .dranchuk_abu_kassem import DranchukAbuKassem
+from .dranchuk_purvis_robinson import DranchukPurvisRobinson
+from .hall_yarborough import HallYarborough
+
+METHODS = {
+	'direct_method': DirectMethod,
+	'dranchuk_abu_kassem': DranchukAbuKassem,
+	'dranchuk_purvis_robinson': DranchukPurvisRobinson,
+	'hall_yarborough': HallYarborough,
+	}
+
 def zfactor(critical_params:tuple,pressures:np.ndarray,temperature:float,derivative:bool=False,method:str="direct_method"):
 	"""
-	Dynamically calculates z-factor based on the specified method.
+	Calculates z-factor based on the specified method. The method classes are
+	imported once with the module, so resolving a method is a dictionary lookup.
 
 	Parameters:
 	    critical_params (tuple): tuple of (pcrit in psi, tcrit in Rankine)
@@ -19,17 +30,9 @@ def zfactor(critical_params:tuple,pressures:np.ndarray,temperature:float,derivat
 	    np.ndarray: Z-factor, and if derivative is True, Z-prime values calculated for each pressure.
 	    
 	"""
-	sys.path.append(os.path.dirname(__file__))
-
-	method_parts = method.split('_')
-
-	method_class = method_parts[0].capitalize()+''.join(word.capitalize() for word in method_parts[1:])
-
-	# Import the correct method class dynamically
 	try:
-		module = __import__(method)
-		mclass = getattr(module,method_class)
-	except (ImportError, AttributeError):
+		mclass = METHODS[method]
+	except KeyError:
 		raise ValueError(f"Method '{method}' not found or invalid.")
 
 	# Create an instance of the class and calculate z-factor
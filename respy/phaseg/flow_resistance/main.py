@@ -1,8 +1,17 @@
 import numpy
 
-def viscosity(spgr,press,temp,*args,method="carr_kobayashi_burrows",**kwags):
+from .carr_kobayashi_burrows import CarrKobayashiBurrows
+from .lee_gonzalez_eakin import LeeGonzalezEakin
+
+METHODS = {
+	'carr_kobayashi_burrows': CarrKobayashiBurrows,
+	'lee_gonzalez_eakin': LeeGonzalezEakin,
+	}
+
+def viscosity(spgr,press,temp,*args,method="carr_kobayashi_burrows",**kwargs):
 	"""
-	Dynamically calculates viscosity based on the specified method.
+	Calculates viscosity based on the specified method. The method classes are
+	imported once with the module, so resolving a method is a dictionary lookup.
 
 	Parameters:
 	    spgr    : specific gravity of the gas at standard conditions.
@@ -17,21 +26,12 @@ def viscosity(spgr,press,temp,*args,method="carr_kobayashi_burrows",**kwags):
 	    
 	"""
 
-	method_parts = method.split('_')
-
-	method_class = method_parts[0].capitalize()+''.join(word.capitalize() for word in method_parts[1:])
-
-	# Import the correct method class dynamically
 	try:
-
-		module = __import__(f'respy.fluid_props.phaseg.viscosity_models',fromlist=[method_class])
-
-		MethodClass = getattr(module,method_class)
-
-	except (ImportError, AttributeError):
+		mclass = METHODS[method]
+	except KeyError:
 		raise ValueError(f"Method '{method}' not found or invalid.")
 
-	# Create an instance of the class and calculate z-factor
-	method_instance = MethodClass(spgr,temp,*args)
+	# Create an instance of the class and calculate viscosity
+	method_instance = mclass(spgr,temp,*args,**kwargs)
 
-	return method_instance(pressures)
\ No newline at end of file
+	return method_instance(press)
@@ -32,8 +32,10 @@ necessary for the petroleum engineer to determine the properties from
 empirically derived correlations.
 
 """
-# from ._standings_correlation import Standing
-# from ._vasquez_beggs_correlation import VasquezBeggs
-# from ._glasos_correlation import Glaso
-# from ._marhouns_correlation import Marhoun
-# from ._petrosky_farshad_correlation import PetroskyFarshad
\ No newline at end of file
+from ._crude_oil_system import CrudeOilSystem
+
+from ._standings_correlation import StandingsCorrelation
+from ._vasquez_beggs_correlation import VasquezBeggsCorrelation
+from ._glasos_correlation import GlasosCorrelation
+from ._marhouns_correlation import MarhounsCorrelation
+from ._petrosky_farshad_correlation import PetroskyFarshadCorrelation
\ No newline at end of file
@@ -1,5 +1,16 @@
+
 import numpy as np
 
+from ._utils import scalar_cache
+
+# API gravity definition: gAPI = _API_NUM/sgco-_API_OFF
+_API_NUM = 141.5
+_API_OFF = 131.5
+
+def _sgco(gAPI:float|np.ndarray):
+	"""Oil specific gravity from API gravity, callable without the class lookup."""
+	return _API_NUM/(gAPI+_API_OFF)
+
 class CrudeOilSystem:
 	"""
 	Petroleum (an equivalent term is crude oil) is a complex mixture
@@ -52,7 +63,7 @@ class CrudeOilSystem:
 		lighter crude oils to 10° API for the heavier asphaltic crude oils.
 
 		"""
-		return 141.5/sgco-131.5
+		return _API_NUM/sgco-_API_OFF
 
 	@staticmethod
 	def gAPI_to_sgco(gAPI:float|np.ndarray):
@@ -68,10 +79,10 @@ class CrudeOilSystem:
 		sgco 	: specific gravity of the oil
 
 		"""
-		return 141.5/(gAPI+131.5)
+		return _sgco(gAPI)
 
 	@staticmethod
-	def get_sgsg(*separators,ST:tuple[float,float]):
+	def get_sgsg(*separators,ST:tuple[float,float],Rsep:np.ndarray=None,gsep:np.ndarray=None,axis:int=0):
 		"""
 		Calculates the specific gravity of the solution gas.
 
@@ -88,6 +99,14 @@ class CrudeOilSystem:
 			Rst = gas-oil ratio from the stock tank, scf/ STB
 			gst = gas gravity from the stock tank
 		
+		The values may also be arrays of equal shape, e.g. one entry per well, in
+		which case the weighted average is returned with that shape.
+
+		Instead of (Rsep,gsep) pairs, the separator data can be given as the two
+		keyword arrays Rsep and gsep, indexed by separator along the given axis
+		(the first one by default), e.g. axis=1 for an (N wells, K separators)
+		table. This is the faster form for many separators as no pairs are unpacked.
+
 		Returns:
 		-------
 		Specific gravity of the solution gas.
@@ -95,16 +114,18 @@ class CrudeOilSystem:
 		"""
 		Rst,gst = ST
 
-		upper = Rst*gst
-		lower = Rst
+		if Rsep is None:
+			# broadcast against each other and stacked as (separators, 2, *shape)
+			*vals,Rst = np.broadcast_arrays(*(x for sep in separators for x in sep),Rst)
 
-		for sep in separators:
-			Rsep,gsep = sep
+			sep = np.array(vals,dtype=np.float64).reshape((len(separators),2)+Rst.shape)
 
-			upper += Rsep*gsep
-			lower += Rsep
+			Rsep,gsep = sep[:,0],sep[:,1]
+		else:
+			Rsep = np.moveaxis(np.asarray(Rsep,dtype=np.float64),axis,0)
+			gsep = np.moveaxis(np.asarray(gsep,dtype=np.float64),axis,0)
 
-		return upper/lower
+		return (np.einsum('i...,i...->...',Rsep,gsep)+Rst*gst)/(Rsep.sum(axis=0)+Rst)
 
 	@staticmethod
 	def get_gassb(sgsg:float,sgco:float,psep:float,Tsep:float):
@@ -127,17 +148,32 @@ class CrudeOilSystem:
 		below the bubblepoint.
 
 		"""
-		A1 =  0.3818
-		A2 = -5.506
-		A3 =  2.902
 		A4 =  1.327
 		A5 = -0.7355
 
-		logRst = A1+A2*np.log(sgco)+A3*np.log(sgsg)+\
+		logRst = CrudeOilSystem.get_gassb_logK(sgsg,sgco)+\
 		            A4*np.log(psep)+A5*np.log(Tsep)
 
 		return np.exp(logRst)
 
+	@staticmethod
+	@scalar_cache(maxsize=1024)
+	def get_gassb_logK(sgsg:float,sgco:float):
+		"""
+		Fluid dependent term of the Rollins-McCain-Creeger stock-tank GOR:
+
+		logK = A1+A2*log(sgco)+A3*log(sgsg)
+
+		It does not depend on the separator conditions, so it is cached for
+		repeated calls with the same fluid.
+
+		"""
+		A1 =  0.3818
+		A2 = -5.506
+		A3 =  2.902
+
+		return A1+A2*np.log(sgco)+A3*np.log(sgsg)
+
 	@staticmethod
 	def get_gass(sgsg:float,sgco:float,rhoo:float,fvfo:float):
 		"""
@@ -1,11 +1,38 @@
+import math
+
 import numpy as np
 
+_LN10 = math.log(10.)
+_LN2_6 = math.log(2.6)
+
 class Viscosity:
 
     # 21. crude oil viscosity
     # 22. methods of calculating the dead oil viscosity
     # 23. methods of calculating the saturated oil viscosity
     # 24. methods of calculating the viscosity of the undersaturated oil
+    @staticmethod
+    def dead(temp, gAPI):
+        """
+        Beggs-Robinson dead oil viscosity in cp, which depends on temperature
+        and oil gravity only and is shared by the saturated and undersaturated
+        branches of oil
+
+        temp   : temperature, °F
+        gAPI   : API oil gravity
+
+        """
+        # 10**z as exp(z*ln10); expm1 keeps 10**x-1 accurate for small x
+        if isinstance(gAPI, (int, float)):
+            Y = math.exp((3.0324 - 0.0203 * gAPI) * _LN10)
+        else:
+            Y = np.exp((3.0324 - 0.0203 * gAPI) * _LN10)
+
+        x = Y * temp ** (-1.163) * _LN10
+
+        return math.expm1(x) if isinstance(x, float) else np.expm1(x)
+
+    @staticmethod
     def oil(temp, p, Tsep, Psep, bpp, Rs, sgsg, gAPI):
         """
         Calculates the Oil Viscosity in cp
@@ -15,24 +42,37 @@ class Viscosity:
         Tsep   : separator temperature, °F
         Psep   : separator pressure, psia
         bpp    : bubble point pressure, psia
-        gass   : solution gas-oil ratio, scf/stb
+        Rs     : solution gas-oil ratio, scf/stb
         sgsg   : gas specific gravity
         gAPI   : API oil gravity
 
+        All inputs may be arrays that broadcast against each other, e.g. one
+        value per grid cell, and are then evaluated without a Python loop.
+
         """
-        a = 10.715 * (gass + 100) ** (-0.515)
-        b = 5.44 * (gass + 150) ** (-0.338)
-        Z = 3.0324 - 0.0203 * gAPI
-        Y = 10 **Z
-        x = Y * temp ** (-1.163)
+        a = 10.715 * (Rs + 100) ** (-0.515)
+        b = 5.44 * (Rs + 150) ** (-0.338)
 
-        visc_oD = 10 ** x - 1
+        # the saturated viscosity at min(p,bpp) is common to both branches
+        visc_ob = a * Viscosity.dead(temp, gAPI) ** b
 
-        if (p <= bpp):
-            visc_o = a * visc_oD ** b
-        else:
-            M = 2.6 * p ** 1.187 * np.exp(-11.513 - 8.98E-05 * p)
-            visc_ob = a * visc_oD ** b
-            visc_o = visc_ob * (p / bpp) ** M
+        if isinstance(p, (int, float)) and isinstance(bpp, (int, float)):
+
+            if (p <= bpp):
+                return visc_ob
+
+            M = 2.6 * p ** 1.187 * math.exp(-11.513 - 8.98E-05 * p)
+
+            return visc_ob * (p / bpp) ** M
+
+        # pressures are raised to the bubble point, where (p/bpp)**M is one,
+        # so a single expression covers both branches
+        p = np.maximum(p, bpp)
+
+        # log(p) is taken once and shared by both powers of p:
+        # M = exp(ln2.6-11.513+1.187*log(p)-8.98e-5*p), (p/bpp)**M = exp(M*log(p/bpp))
+        logp = np.log(p)
+
+        M = np.exp(1.187 * logp - 8.98E-05 * p + (_LN2_6 - 11.513))
 
-        return visc_o
\ No newline at end of file
+        return visc_ob * np.exp(M * (logp - np.log(bpp)))
@@ -2,7 +2,8 @@ import numpy as np
 
 class GasOilInterfacialTension:
 	
-	def tens(p:np.ndarray,gAPI:float,temp:float):
+	@staticmethod
+	def tens(p:float|np.ndarray,gAPI:float,temp:float|np.ndarray):
 		"""Function to Calculate Gas-Oil Interfacial Tension in dynes/cm
 
 		p      : pressure, psia
@@ -10,21 +11,26 @@ class GasOilInterfacialTension:
 		gAPI   : API oil gravity
 		temp   : temperature, °F
 
+		The dead oil tension is taken at 68°F below 68°F, at 100°F above
+		100°F and linearly interpolated in between. Pressure and temperature
+		can be given as arrays, and the result is never less than 1 dynes/cm.
+
 		"""
 		s068 = 39.0 - 0.2571 * gAPI
-		s100 = 37.5 - 0.2571 * gAPI
-
-		if (temp <= 68):
-		    st = s068
-		elif (temp >= 100):
-		    st = s100
-		else:
-		    st = s068 - (temp - 68) * (s068 - s100) / 32
-
-		c = 1 - 0.024 * p ** 0.45
-		so = c * st
-		
-		if so < 1:
-		    so = 1
-
-		return so
\ No newline at end of file
+
+		# s068 - s100 is 1.5 for every API gravity, so the slope is constant
+		st = s068 - (np.clip(temp, 68., 100.) - 68) * (1.5 / 32)
+
+		# c = 1 - 0.024 * p ** 0.45, evaluated through log/exp in one buffer;
+		# p = 0 gives log(0) = -inf and exp(-inf) = 0 as p**0.45 does, so its
+		# warning is silenced
+		p = np.asarray(p, dtype=np.float64)
+
+		with np.errstate(divide='ignore'):
+			c = np.log(p, out=np.empty_like(p))
+		c *= 0.45
+		np.exp(c, out=c)
+		c *= -0.024
+		c += 1
+
+		return np.maximum(c * st, 1.)
\ No newline at end of file
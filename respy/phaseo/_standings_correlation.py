@@ -1,10 +1,47 @@
+import math
+
 import numpy as np
 
-from ._crude_oil_system import CrudeOilSystem as cos
+from ._crude_oil_system import _API_NUM,_API_OFF
+
+from ._utils import BACKEND,numexpr,as1d,scalar_cache,evaluate_batch
+
+# reciprocals of the Standing constants, so the kernels multiply instead of divide
+_INV_18_2 = 1./18.2
+_INV_083 = 1./0.83
+
+# ln(10)/0.83, so that 10**(x/0.83) is taken as exp(x*_LN10_083)
+_LN10_083 = math.log(10.)/0.83
+
+# p/18.2+1.4 written as (p+_P_OFF)/18.2, with the 18.2**(-1/0.83) of the
+# power moved into the pressure independent factor
+_P_OFF = 1.4*18.2
+_P_SCALE = 18.2**(-_INV_083)
+
+# 0.00012*t**1.2 of Standing's Bo written as (_BO_SCALE*t)**1.2
+_BO_SCALE = 0.00012**(1/1.2)
 
 class StandingsCorrelation:
 
 	@staticmethod
+	@scalar_cache(maxsize=4096)
+	def get_K(sgsg:float,gAPI:float,temp:float):
+		"""
+		Pressure independent factor of the Standing correlation:
+
+		K = sgsg*10**((0.0125*gAPI-0.00091*temp)/0.83)
+
+		so that Rs = K*(p/18.2+1.4)**(1/0.83). It is fixed for a given fluid
+		and temperature, and is cached for repeated calls with the same inputs.
+
+		"""
+		x = 0.0125*gAPI-0.00091*temp
+
+		# math.exp for the usual scalar fluid, np.exp for per-sample arrays
+		return sgsg*(math.exp(x*_LN10_083) if isinstance(x,float) else np.exp(x*_LN10_083))
+
+	@staticmethod
+	@scalar_cache(maxsize=4096)
 	def gassb_to_bpp(gassb:float,sgsg:float,gAPI:float,temp:float):
 		"""
 		Calculates the bubblepoint pressure of the oil at reservoir conditions
@@ -21,14 +58,25 @@ class StandingsCorrelation:
 		if nonhydrocarbon components are known to be present in the system.
 
 		"""
-		x = 0.00091*temp-0.0125*gAPI
+		K = StandingsCorrelation.get_K(sgsg,gAPI,temp)
+
+		return 18.2*((gassb/K)**0.83-1.4)
+
+	@staticmethod
+	def get_sqrt(sgsg:float,gAPI:float):
+		"""
+		Gravity factor (sgsg/sgco)**0.5 shared by Standing's Bo and its
+		pressure derivative, with sgco = 141.5/(gAPI+131.5) substituted so
+		that no division is needed.
 
-		Cpb = (gassb/sgsg)**0.83*10**x
+		It is two float operations for a scalar fluid, cheaper than any cache
+		lookup, so it is recomputed rather than memoized.
 
-		return 18.2*(Cpb-1.4)
+		"""
+		return (sgsg*(gAPI+_API_OFF)/_API_NUM)**0.5
 
 	@staticmethod
-	def gass_sat(p:float|np.ndarray,sgsg:float,gAPI:float,temp:float):
+	def gass_sat(p:float|np.ndarray,sgsg:float,gAPI:float,temp:float,out:np.ndarray=None,dtype=np.float64):
 		"""
 		Standing (1947) proposed a graphical correlation for determining the
 		gas solubility as a function of pressure, gas specific gravity, API gravity,
@@ -49,13 +97,50 @@ class StandingsCorrelation:
 		gAPI : API gravity of oil, dimensionless
 		temp : System temperature, °F
 
+		out  : optional array the result is written into, e.g. a buffer
+		       reused across the iterations of a Newton solver
+		dtype: floating point type of the evaluation; np.float32 halves the
+		       memory traffic, and its ~1e-6 relative error is far below the
+		       4.8% error of the correlation itself
+
 		It should be noted that Standing’s equation is valid for applications at
 		and below the bubble-point pressure of the crude oil.
 
+		Array pressures are converted once to a contiguous array of dtype, and
+		the result has that dtype as well.
+
 		"""
-		x = 0.0125*gAPI-0.00091*temp
+		K = StandingsCorrelation.get_K(sgsg,gAPI,temp)
+
+		# a scalar pressure in a user loop is evaluated with float arithmetic,
+		# which avoids the ufunc dispatch of the array path below; plain floats
+		# are recognized first, as np.ndim itself costs about a microsecond
+		if isinstance(p,(int,float)) or np.ndim(p)==0:
+			return K*(p*_INV_18_2+1.4)**_INV_083
+
+		p = as1d(p,dtype)
+
+		# the result buffer has the broadcast shape of pressure and K, so the
+		# fluid descriptors may vary with p as well, e.g. one fluid per
+		# Monte-Carlo sample, and everything below still runs in place
+		if out is None:
+			out = np.empty_like(p,shape=np.broadcast_shapes(p.shape,np.shape(K)))
+
+		x = out
 
-		return sgsg*((p/18.2+1.4)*10**x)**(1./0.83)
+		if BACKEND=="numexpr" and x.dtype==np.float64:
+			return numexpr.evaluate("K*(p*a+1.4)**b",out=x,
+				local_dict=dict(K=K,p=p,a=_INV_18_2,b=_INV_083))
+
+		# the pressure term with the fractional power taken as exp(log(x)/0.83);
+		# the shifted pressure needs one add instead of a multiply and an add
+		np.add(p,_P_OFF,out=x)
+		np.log(x,out=x)
+		x *= _INV_083
+		np.exp(x,out=x)
+		x *= K*_P_SCALE
+
+		return x
 
 	@staticmethod
 	def gass_sat_prime(p:float|np.ndarray,sgsg:float,gAPI:float,temp:float):
@@ -92,10 +177,19 @@ class StandingsCorrelation:
 		"""
 		gass = StandingsCorrelation.gass_sat(p,sgsg,gAPI,temp)
 
-		return gass/(0.83*p+21.1484)
+		if not isinstance(gass,np.ndarray):
+			return gass/(0.83*p+21.1484)
+
+		# 0.83*p+21.1484 is 0.83*18.2*(p/18.2+1.4), the base of the power in
+		# gass_sat; it is built in one array and divided into gass in place
+		den = np.multiply(p,0.83)
+		den += 21.1484
+		gass /= den
+
+		return gass
 
 	@staticmethod
-	def fvf_sat(p:float|np.ndarray,sgsg:float,gAPI:float,temp:float):
+	def fvf_sat(p:float|np.ndarray,sgsg:float,gAPI:float,temp:float,out:np.ndarray=None,dtype=np.float64):
 		"""
 		Standing (1947) presented a graphical correlation for estimating the oil
 		formation volume factor with the gas solubility, gas gravity, oil gravity,
@@ -116,14 +210,27 @@ class StandingsCorrelation:
 		gAPI : API gravity of oil, dimensionless
 		temp : Temperature, °T
 
+		out  : optional array Bo is written into
+		dtype: floating point type of the evaluation, as in gass_sat
+
 		"""
-		sgco = cos.gAPI_to_sgco(gAPI)
+		sqrt = StandingsCorrelation.get_sqrt(sgsg,gAPI)
 
-		gass = StandingsCorrelation.gass_sat(p,sgsg,gAPI,temp)
+		gass = StandingsCorrelation.gass_sat(p,sgsg,gAPI,temp,out=out,dtype=dtype)
+
+		if not isinstance(gass,np.ndarray):
+			return 0.9759+0.00012*(gass*sqrt+1.25*temp)**1.2
 
-		CBob = gass*(sgsg/sgco)**0.5+1.25*temp
+		# Bo is composed on the fresh gass array in place, so the pipeline
+		# gass_sat -> fvf_sat works on one buffer from pressure to Bo
+		# the 0.00012 factor is folded into the scalar coefficients inside the
+		# power, which saves a full pass over the array
+		CBob = np.multiply(gass,sqrt*_BO_SCALE,out=gass)
+		CBob += 1.25*_BO_SCALE*temp
+		CBob **= 1.2
+		CBob += 0.9759
 
-		return 0.9759+0.00012*CBob**1.2
+		return CBob
 
 	@staticmethod
 	def fvf_sat_prime(p:float|np.ndarray,sgsg:float,gAPI:float,temp:float):
@@ -182,21 +289,36 @@ class StandingsCorrelation:
 		2.4e-05
 
 		"""
-		sgco = cos.gAPI_to_sgco(gAPI)
+		sqrt = StandingsCorrelation.get_sqrt(sgsg,gAPI)
 
 		gass = StandingsCorrelation.gass_sat(p,sgsg,gAPI,temp)
 
-		gassp = StandingsCorrelation.gass_sat_prime(p,sgsg,gAPI,temp)
+		# same expression as gass_sat_prime, reusing gass instead of recomputing it
+		if not isinstance(gass,np.ndarray):
+			return 0.000144*sqrt*gass/(0.83*p+21.1484)*(gass*sqrt+1.25*temp)**0.2
 
-		sqrt = (sgsg/sgco)**0.5
+		# the product is built in place on one array next to gass, with the
+		# 0.2 power taken through log/exp
+		dBo = np.multiply(gass,sqrt)
+		dBo += 1.25*temp
+		np.log(dBo,out=dBo)
+		dBo *= 0.2
+		np.exp(dBo,out=dBo)
+		dBo *= gass
 
-		return 0.000144*(gass*sqrt+1.25*temp)**0.2*gassp*sqrt
+		# gass is no longer needed and holds the denominator instead
+		np.multiply(p,0.83,out=gass)
+		gass += 21.1484
+		dBo /= gass
+		dBo *= 0.000144*sqrt
+
+		return dBo
 
 if __name__ == "__main__":
 
-	print(StandingsCorrelation.gass(250,2377+14.7,47.1,0.851))
-	print(StandingsCorrelation.gass(220,2620+14.7,40.7,0.855))
-	print(StandingsCorrelation.gass(260,2051+14.7,48.6,0.911))
-	print(StandingsCorrelation.gass(237,2884+14.7,40.5,0.898))
-	print(StandingsCorrelation.gass(218,3045+14.7,44.2,0.781))
-	print(StandingsCorrelation.gass(180,4239+14.7,27.3,0.848))
\ No newline at end of file
+	temp = np.array([250,220,260,237,218,180])
+	bpp  = np.array([2377,2620,2051,2884,3045,4239])+14.7
+	gAPI = np.array([47.1,40.7,48.6,40.5,44.2,27.3])
+	sgsg = np.array([0.851,0.855,0.911,0.898,0.781,0.848])
+
+	print(evaluate_batch(StandingsCorrelation.gass_sat,bpp,sgsg,gAPI,temp))
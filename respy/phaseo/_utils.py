@@ -0,0 +1,180 @@
+import functools
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# RESPY_PHASEO_BACKEND=numexpr evaluates the array kernels with numexpr's
+# multi-threaded engine; numpy is the default and is used as well when
+# numexpr is not installed
+try:
+	import numexpr
+except ImportError:
+	numexpr = None
+
+BACKEND = os.environ.get('RESPY_PHASEO_BACKEND','numpy').lower()
+
+if BACKEND!="numexpr" or numexpr is None:
+	BACKEND = "numpy"
+
+def scalar_cache(maxsize:int=128):
+	"""
+	Memoizes a correlation with functools.lru_cache for scalar inputs.
+
+	Parameter sweeps often repeat the same scalar fluid description, so the
+	result is looked up instead of recomputed. Calls with any array argument
+	bypass the cache, since arrays are not hashable.
+
+	"""
+	def decorator(func):
+
+		cached = functools.lru_cache(maxsize=maxsize)(func)
+
+		@functools.wraps(func)
+		def wrapper(*args,**kwargs):
+			# hashing the arguments is the scalar test: it costs less than
+			# checking each with np.isscalar, and arrays fail it right away;
+			# it is done up front, so a TypeError raised by func propagates
+			# instead of running func a second time
+			try:
+				hash(args)
+				hash(tuple(kwargs.values()))
+			except TypeError:
+				return func(*args,**kwargs)
+
+			return cached(*args,**kwargs)
+
+		wrapper.cache_info = cached.cache_info
+		wrapper.cache_clear = cached.cache_clear
+
+		return wrapper
+
+	return decorator
+
+def as1d(p:float|np.ndarray,dtype=np.float64):
+	"""
+	Returns p unchanged when it is already a C-contiguous array of the given
+	dtype (float64 by default) and at least one dimension, otherwise converts
+	it to one.
+
+	It replaces np.atleast_1d in the correlation hot paths, where the input is
+	usually an array already and the function call overhead adds up. Lists,
+	float32 and strided inputs are copied once here, so the ufuncs that follow
+	run on contiguous double precision data.
+
+	Arrays of other libraries that override NumPy ufuncs (e.g. CuPy device
+	arrays) are returned as they are, so np.log, np.exp etc. in the kernels
+	dispatch to that library and the evaluation stays on its device.
+
+	"""
+	if isinstance(p,np.ndarray):
+		if p.ndim>=1 and p.dtype==dtype and p.flags.c_contiguous:
+			return p
+	elif hasattr(p,'__array_ufunc__'):
+		return p
+
+	return np.ascontiguousarray(p,dtype=dtype)
+
+
+def sweep(func,p:np.ndarray,*args,chunk:int=50_000,workers:int|None=None,**kwargs):
+	"""
+	Evaluates func(p,*args,**kwargs) over a long one-dimensional pressure
+	array by splitting it into chunks that run on a thread pool.
+
+	NumPy ufuncs release the GIL, so the chunks of a correlation kernel run
+	on separate cores. Arrays shorter than two chunks, multi-dimensional
+	arrays and single-core machines are evaluated in one call.
+
+	Arguments that are one-dimensional arrays as long as p, e.g. the gas
+	gravity, API gravity and temperature of every grid cell, are split with
+	it, so a pointwise correlation runs cell by cell on all cores:
+
+	>>> Rs = sweep(StandingsCorrelation.gass_sat,p,sgsg,gAPI,temp)
+
+	"""
+	p = as1d(p)
+
+	if p.ndim!=1 or p.size<2*chunk or (os.cpu_count() or 1)<2:
+		return func(p,*args,**kwargs)
+
+	def cells(x,s):
+		return x[s] if isinstance(x,np.ndarray) and x.shape==p.shape else x
+
+	def part(s):
+		return func(p[s],*(cells(x,s) for x in args),**{k:cells(x,s) for k,x in kwargs.items()})
+
+	# near-equal parts of at most chunk pressures, as np.array_split makes
+	parts = -(-p.size//chunk)
+	size = -(-p.size//parts)
+
+	with ThreadPoolExecutor(max_workers=workers) as pool:
+		# the parts are joined along the last axis, which is the pressure axis
+		# of batch results shaped (samples, pressures) as well
+		return np.concatenate(list(pool.map(part,(slice(i,i+size) for i in range(0,p.size,size)))),axis=-1)
+
+def blockwise(func,p:np.ndarray,*args,block:int=32_768,**kwargs):
+	"""
+	Evaluates func(p,*args,out=...,**kwargs) over a long one-dimensional
+	pressure array block by block, writing every block into its slice of a
+	single result array.
+
+	The in-place kernels (gass_sat of every correlation, fvf_sat of Standing
+	and Vasquez-Beggs) make several passes over their buffer. On blocks that fit in the CPU cache
+	these passes no longer stream the whole array through main memory each
+	time. The other arguments must not vary with pressure.
+
+	"""
+	p = as1d(p)
+
+	if p.ndim!=1 or p.size<=block:
+		return func(p,*args,**kwargs)
+
+	out = np.empty_like(p)
+
+	for i in range(0,p.size,block):
+		func(p[i:i+block],*args,out=out[i:i+block],**kwargs)
+
+	return out
+
+def newton(func,prime,target:float|np.ndarray,*args,p0:float=2000.,nit:int=8):
+	"""
+	Solves func(p,*args)=target for pressure with a fixed number of
+	vectorized Newton-Raphson steps, using the analytic derivative prime,
+	e.g. the pressure at which a correlation yields a measured gas solubility:
+
+	>>> p = newton(StandingsCorrelation.gass_sat,StandingsCorrelation.gass_sat_prime,Rs,sgsg,gAPI,temp)
+
+	An array of targets is solved in the same steps instead of a Python loop
+	over its elements. The gas solubility correlations are convex in pressure,
+	so the iteration converges from the default start within about six steps.
+
+	With prime=None, func returns the value and the derivative together,
+	e.g. VasquezBeggsCorrelation.fvf_sat_and_prime, so that the work they
+	share is done once per step.
+
+	"""
+	p = np.full(np.shape(target),p0)
+
+	for _ in range(nit):
+		if prime is None:
+			f,fp = func(p,*args)
+		else:
+			f,fp = func(p,*args),prime(p,*args)
+		p -= (f-target)/fp
+
+	return p[()]
+
+def evaluate_batch(func,*args,**kwargs):
+	"""
+	Evaluates func once on all samples of a data set instead of once per
+	sample. The positional arguments (scalars or arrays) are broadcast to
+	equal length float64 arrays, so the correlation runs under a single
+	vectorized call:
+
+	>>> Rsb = evaluate_batch(GlasosCorrelation.gass_sat,pb,sgsg,gAPI,temp)
+
+	"""
+	arrays = np.broadcast_arrays(*(np.asarray(arg,dtype=np.float64) for arg in args))
+
+	return func(*arrays,**kwargs)
@@ -1,24 +1,20 @@
-import os, sys
+from .models._stones_I import StonesI
+from .models._stones_II import StonesII
+from .models._aziz_settari import AzizSettari
+from .models._hustad_holt import HustadHolt
+
+METHODS = {
+	'stones_I': StonesI,
+	'stones_II': StonesII,
+	'aziz_settari': AzizSettari,
+	'hustad_holt': HustadHolt,
+	}
 
 def phase3(method="stones_I",**kwargs):
 	"""models = ["Stones I","Aziz Settari","Stones II","Hustad Holt"]"""
-	sys.path.append(os.path.dirname(__file__))
-
-	method_parts = method.split('_')
-
-	method_class = method_parts[0].capitalize()+''.join(word.capitalize() for word in method_parts[1:])
-
-    # Import the correct method class dynamically
 	try:
-		module = __import__(method)
-		mclass = getattr(module,method_class)
-	except (ImportError, AttributeError):
+		mclass = METHODS[method]
+	except KeyError:
 		raise ValueError(f"Method '{method}' not found or invalid.")
 
-	# Create an instance of the class and calculate z-factor
-	method_instance = mclass(**kwargs)
-
-	return method_instance
-
-
-    
\ No newline at end of file
+	return mclass(**kwargs)
@@ -3,7 +3,7 @@ from setuptools import setup, find_packages
 setup(
 	name = 'respy',
 	version = '0.0.14',
-	packages = find_packages(),
+	packages = find_packages(exclude=['build*','dist*','docs*']),
 	install_requires = [
 		'numpy>=1.26.4',
 		'scipy>=1.13.0',
@@ -0,0 +1,21 @@
+import unittest
+
+import numpy as np
+
+from respy.phaseo._crude_oil_system import CrudeOilSystem
+
+class TestCrudeOilSystem(unittest.TestCase):
+
+    def test_comp_sat_nonpositive_pressure(self):
+        # scalar calls follow the numpy semantics of array calls: inf at zero
+        # pressure, nan below it, instead of a math domain error
+        with np.errstate(divide='ignore',invalid='ignore'):
+            self.assertEqual(CrudeOilSystem.get_comp_sat(0.,0.8,30.,180.,400.,2500.),np.inf)
+            self.assertTrue(np.isnan(CrudeOilSystem.get_comp_sat(-1.,0.8,30.,180.,400.,2500.)))
+
+    def test_gassb_zero_separator_pressure(self):
+        with np.errstate(divide='ignore'):
+            self.assertEqual(CrudeOilSystem.get_gassb(0.8,0.85,0.,60.),0.)
+
+if __name__ == "__main__":
+    unittest.main()
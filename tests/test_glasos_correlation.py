@@ -0,0 +1,17 @@
+import unittest
+
+import numpy as np
+
+from respy.phaseo._glasos_correlation import GlasosCorrelation
+
+class TestGlasosCorrelation(unittest.TestCase):
+
+    def test_gass_sat_out_of_range(self):
+        # the correlation is undefined above 10**(14.1811/3.3093) = 19285 psia
+        Rs = GlasosCorrelation.gass_sat(np.array([1000.,19000.,19300.,25000.]),0.85,35.,180.)
+
+        self.assertTrue(np.isfinite(Rs[:2]).all())
+        self.assertTrue(np.isnan(Rs[2:]).all())
+
+if __name__ == "__main__":
+    unittest.main()
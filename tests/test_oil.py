@@ -0,0 +1,142 @@
+import unittest
+
+from unittest import mock
+
+import numpy as np
+
+from respy import OilPhase, OilPhaseBatch
+
+from respy.phaseo import VasquezBeggsCorrelation
+
+SAMPLES = [(0.85,25.,180.),(0.9,35.,200.),(0.75,45.,160.)]
+
+class TestOilPhaseBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.batch = OilPhaseBatch(*zip(*SAMPLES))
+        self.p = np.linspace(500,4500,9)
+
+    def assert_per_sample(self,prop,bpp,method='vasquez-beggs'):
+        # every row of a batch result equals the OilPhase result of its sample
+        result = getattr(self.batch,prop)(self.p,bpp,method)
+
+        self.assertEqual(result.shape,(len(SAMPLES),self.p.size))
+
+        for i,sample in enumerate(SAMPLES):
+            expected = getattr(OilPhase(*sample),prop)(self.p,np.broadcast_to(bpp,len(SAMPLES))[i],method)
+            np.testing.assert_allclose(result[i],expected,rtol=1e-12)
+
+    def test_per_sample_parity(self):
+        for prop in ('gass','fvf','comp','rho'):
+            for bpp in (2500.,np.array([2000.,2500.,3000.])):
+                with self.subTest(prop=prop,bpp=bpp):
+                    self.assert_per_sample(prop,bpp)
+
+    def test_per_sample_parity_standing(self):
+        # standing only covers the saturated range
+        self.p = np.linspace(500,2000,7)
+
+        for prop in ('gass','rho'):
+            for bpp in (2500.,np.array([2000.,2500.,3000.])):
+                with self.subTest(prop=prop,bpp=bpp):
+                    self.assert_per_sample(prop,bpp,'standing')
+
+    def test_pvt(self):
+        Rs,Bo,co = self.batch.pvt(self.p,2500.)
+
+        np.testing.assert_allclose(Rs,self.batch.gass(self.p,2500.),rtol=1e-12)
+        np.testing.assert_allclose(Bo,self.batch.fvf(self.p,2500.),rtol=1e-12)
+        np.testing.assert_allclose(co,self.batch.comp(self.p,2500.),rtol=1e-12)
+
+    def test_from_records(self):
+        batch = OilPhaseBatch.from_records(SAMPLES)
+
+        np.testing.assert_array_equal(batch.fvf(self.p,2500.),self.batch.fvf(self.p,2500.))
+
+    def test_sweep_joins_pressure_axis(self):
+        p = np.linspace(500,4500,1001)
+
+        with mock.patch('respy.phaseo._utils.os.cpu_count',return_value=4):
+            Bo = self.batch.sweep('fvf',p,2500.,chunk=100)
+
+        np.testing.assert_allclose(Bo,self.batch.fvf(p,2500.),rtol=1e-12)
+
+    def test_rho_scalar_bpp(self):
+        # a single bubble point for the whole batch broadcasts against the
+        # (samples, pressures) shape of the compressibility
+        batch = OilPhaseBatch([0.85,0.9],[25.,35.],[180.,200.])
+
+        p = np.linspace(1000,4000,5)
+
+        rho = batch.rho(p,2500.)
+
+        self.assertEqual(rho.shape,(2,5))
+
+        for i,(sgsg,gAPI,temp) in enumerate(zip([0.85,0.9],[25.,35.],[180.,200.])):
+            np.testing.assert_allclose(rho[i],OilPhase(sgsg,gAPI,temp).rho(p,2500.),rtol=1e-12)
+
+class TestOilPhase(unittest.TestCase):
+
+    def test_rho_methods(self):
+        # every registered method either gives a finite density or says
+        # clearly which part of the correlation is missing
+        oil = OilPhase(0.85,35.,180.)
+
+        for p in (np.linspace(500,2500,5),np.linspace(1000,4000,5)):
+            for method in OilPhase.METHODS:
+                with self.subTest(method=method,pmax=p.max()):
+                    try:
+                        rho = oil.rho(p,2500.,method)
+                    except ValueError as error:
+                        self.assertIn(method,str(error))
+                    else:
+                        self.assertTrue(np.isfinite(rho).all())
+
+    def test_at_separator(self):
+        # correcting the gas gravity once equals passing the separator
+        # conditions to every Vasquez-Beggs call
+        oil,p = OilPhase(0.85,35.,180.),np.linspace(1000,4000,7)
+
+        for prop in ('gass','fvf','comp'):
+            with self.subTest(prop=prop):
+                np.testing.assert_allclose(
+                    getattr(oil.at_separator(164.7,60.),prop)(p,2500.),
+                    getattr(oil,prop)(p,2500.,psep=164.7,Tsep=60.),rtol=1e-12)
+
+    def test_register(self):
+        class Correlation(VasquezBeggsCorrelation):
+            pass
+
+        oil,p = OilPhase(0.85,35.,180.),np.linspace(1000,4000,7)
+
+        with mock.patch.dict(OilPhase.METHODS):
+            OilPhase.register('custom',Correlation)
+            np.testing.assert_array_equal(oil.fvf(p,2500.,'custom'),oil.fvf(p,2500.))
+
+        self.assertNotIn('custom',OilPhase.METHODS)
+
+        with self.assertRaises(ValueError):
+            oil.call('custom')
+
+    def test_sweep(self):
+        oil,p = OilPhase(0.85,35.,180.),np.linspace(500,4500,1001)
+
+        with mock.patch('respy.phaseo._utils.os.cpu_count',return_value=4):
+            for prop in ('gass','fvf','comp'):
+                with self.subTest(prop=prop):
+                    np.testing.assert_allclose(
+                        oil.sweep(prop,p,2500.,chunk=100),getattr(oil,prop)(p,2500.),rtol=1e-12)
+
+    def test_rho_saturated_without_comp_nonsat(self):
+        # standing has no comp_nonsat but needs none at or below the bubble point
+        p = np.linspace(500,2500,5)
+
+        rho = OilPhase(0.85,35.,180.).rho(p,2500.,'standing')
+
+        self.assertEqual(rho.shape,p.shape)
+
+        with self.assertRaises(ValueError):
+            OilPhase(0.85,35.,180.).rho(p+1000,2500.,'standing')
+
+if __name__ == "__main__":
+    unittest.main()
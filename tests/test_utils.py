@@ -0,0 +1,86 @@
+import unittest
+
+from unittest import mock
+
+import numpy as np
+
+from respy.phaseo import StandingsCorrelation, VasquezBeggsCorrelation
+
+from respy.phaseo._utils import scalar_cache, sweep, blockwise, newton, evaluate_batch
+
+class TestScalarCache(unittest.TestCase):
+
+    def test_scalar_and_array_calls(self):
+        calls = []
+
+        @scalar_cache(maxsize=8)
+        def square(x):
+            calls.append(x)
+            return x*x
+
+        self.assertEqual(square(3.),9.)
+        self.assertEqual(square(3.),9.)
+        self.assertEqual(len(calls),1)
+
+        np.testing.assert_array_equal(square(np.array([1.,2.])),[1.,4.])
+        self.assertEqual(square.cache_info().currsize,1)
+
+    def test_type_error_of_func_propagates(self):
+        calls = []
+
+        @scalar_cache()
+        def fail(x):
+            calls.append(x)
+            raise TypeError("raised by func")
+
+        with self.assertRaisesRegex(TypeError,"raised by func"):
+            fail(1.)
+
+        # the cached call failed, func must not be run a second time
+        self.assertEqual(len(calls),1)
+
+class TestKernels(unittest.TestCase):
+
+    def setUp(self):
+        self.p = np.linspace(100,5000,1001)
+        self.props = (0.85,35.,180.)
+
+    def test_sweep_splits_cell_arguments(self):
+        # per-cell properties as long as p are split with it
+        sgsg = np.linspace(0.6,1.0,self.p.size)
+
+        with mock.patch('respy.phaseo._utils.os.cpu_count',return_value=4):
+            Rs = sweep(StandingsCorrelation.gass_sat,self.p,sgsg,35.,180.,chunk=100)
+
+        np.testing.assert_allclose(Rs,StandingsCorrelation.gass_sat(self.p,sgsg,35.,180.),rtol=1e-12)
+
+    def test_blockwise(self):
+        for func in (StandingsCorrelation.gass_sat,VasquezBeggsCorrelation.fvf_sat):
+            with self.subTest(func=func.__qualname__):
+                np.testing.assert_allclose(
+                    blockwise(func,self.p,*self.props,block=128),func(self.p,*self.props),rtol=1e-12)
+
+    def test_newton(self):
+        target = StandingsCorrelation.gass_sat(np.array([500.,1500.,3000.]),*self.props)
+
+        p = newton(StandingsCorrelation.gass_sat,StandingsCorrelation.gass_sat_prime,target,*self.props)
+
+        np.testing.assert_allclose(p,[500.,1500.,3000.],rtol=1e-8)
+
+    def test_newton_combined_prime(self):
+        target = VasquezBeggsCorrelation.fvf_sat(np.array([500.,1500.,3000.]),*self.props)
+
+        p = newton(VasquezBeggsCorrelation.fvf_sat_and_prime,None,target,*self.props)
+
+        np.testing.assert_allclose(p,[500.,1500.,3000.],rtol=1e-8)
+
+    def test_evaluate_batch(self):
+        pb,sgsg = [1500.,2500.,3500.],[0.7,0.8,0.9]
+
+        Rsb = evaluate_batch(StandingsCorrelation.gass_sat,pb,sgsg,35.,180.)
+
+        for i in range(3):
+            np.testing.assert_allclose(Rsb[i],StandingsCorrelation.gass_sat(pb[i],sgsg[i],35.,180.),rtol=1e-12)
+
+if __name__ == "__main__":
+    unittest.main()